@@ -14,6 +14,11 @@ from elliptic_curves.output import TaskResultFormatter
 from elliptic_curves.parser.input_stream import metrics
 from elliptic_curves.parser.input_stream import Parser
 
+try:
+    import gmpy2
+except ImportError:  # gmpy2 - необязательная зависимость, без нее координаты - int
+    gmpy2 = None
+
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +42,9 @@ registry.register(point_formatter)
 registry.register(task_config_formatter)
 registry.register(task_result_config)
 
+if gmpy2 is not None:
+    registry.register(int_formatter, type_=gmpy2.mpz)
+
 
 VERBOSE = False
 
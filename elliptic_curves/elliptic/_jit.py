@@ -0,0 +1,80 @@
+"""Скомпилированное numba умножение точки на скаляр для кривых над Z_p
+
+Numba работает только с машинными целыми (int64), поэтому ускоренный путь
+применим лишь к полям, у которых произведение двух элементов помещается в int64.
+Если numba не установлена, функции остаются обычными python функциями.
+"""
+try:
+    from numba import njit
+except ImportError:  # numba - необязательная зависимость
+    njit = None
+
+NUMBA_AVAILABLE = njit is not None
+
+# Произведение двух элементов поля должно помещаться в int64
+MAX_ORDER = 2 ** 31
+MAX_SCALAR = 2 ** 63 - 1
+
+# Бесконечно удаленная точка кодируется отрицательной координатой
+INFINITY = -1
+
+
+if not NUMBA_AVAILABLE:
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+
+        return decorator
+
+
+@njit(cache=True)
+def invert(element, p):
+    s, prev_s = 0, 1
+    r, prev_r = p, element
+
+    while r != 0:
+        quotient = prev_r // r
+
+        prev_r, r = r, prev_r - quotient * r
+        prev_s, s = s, prev_s - quotient * s
+
+    return prev_s % p
+
+
+@njit(cache=True)
+def add_affine(x1, y1, x2, y2, a, p):
+    """Складывает две точки, координаты которых уже приведены по модулю p
+    """
+    if x1 == INFINITY:
+        return x2, y2
+
+    if x2 == INFINITY:
+        return x1, y1
+
+    if x1 != x2:
+        k = (y2 - y1) * invert((x2 - x1) % p, p) % p
+    elif y1 != y2 or y1 == 0:
+        return INFINITY, INFINITY
+    else:
+        k = (3 * (x1 * x1 % p) + a) % p * invert(2 * y1 % p, p) % p
+
+    x3 = (k * k - x1 - x2) % p
+    y3 = (k * (x1 - x3) - y1) % p
+
+    return x3, y3
+
+
+@njit(cache=True)
+def scalar_mul(x, y, scalar, a, p):
+    result_x, result_y = INFINITY, INFINITY
+    addend_x, addend_y = x, y
+
+    while scalar:
+        if scalar & 1:
+            result_x, result_y = add_affine(result_x, result_y, addend_x, addend_y, a, p)
+
+        addend_x, addend_y = add_affine(addend_x, addend_y, addend_x, addend_y, a, p)
+
+        scalar >>= 1
+
+    return result_x, result_y
@@ -0,0 +1,279 @@
+# cython: language_level=3
+"""Умножение точки кривой над Z_p на скаляр целиком на C поверх GMP
+
+Сборка: python setup.py build_ext --inplace (нужны Cython и libgmp).
+Внутри цикла точка хранится в координатах Якоби, python объекты создаются
+только при переводе аргументов и результата.
+"""
+from cpython.mem cimport PyMem_Free, PyMem_Malloc
+
+
+cdef extern from "gmp.h":
+    ctypedef struct __mpz_struct:
+        pass
+    ctypedef __mpz_struct mpz_t[1]
+
+    void mpz_init(mpz_t)
+    void mpz_clear(mpz_t)
+    int mpz_set_str(mpz_t, const char *, int)
+    char *mpz_get_str(char *, int, const mpz_t)
+    size_t mpz_sizeinbase(const mpz_t, int)
+    void mpz_set(mpz_t, const mpz_t)
+    void mpz_set_ui(mpz_t, unsigned long)
+    void mpz_add(mpz_t, const mpz_t, const mpz_t)
+    void mpz_sub(mpz_t, const mpz_t, const mpz_t)
+    void mpz_mul(mpz_t, const mpz_t, const mpz_t)
+    void mpz_mul_ui(mpz_t, const mpz_t, unsigned long)
+    void mpz_mod(mpz_t, const mpz_t, const mpz_t)
+    int mpz_invert(mpz_t, const mpz_t, const mpz_t)
+    int mpz_tstbit(const mpz_t, unsigned long)
+    int mpz_sgn(const mpz_t)
+
+
+cdef struct Context:
+    mpz_t a
+    mpz_t p
+    mpz_t t0
+    mpz_t t1
+    mpz_t t2
+    mpz_t t3
+    mpz_t t4
+    mpz_t t5
+    mpz_t t6
+    mpz_t t7
+
+
+cdef void _set_int(mpz_t target, object value):
+    cdef bytes digits = format(value, 'x').encode()
+    mpz_set_str(target, digits, 16)
+
+
+cdef object _get_int(const mpz_t value):
+    cdef size_t size = mpz_sizeinbase(value, 16) + 2
+    cdef char *buffer = <char *>PyMem_Malloc(size)
+    if buffer == NULL:
+        raise MemoryError()
+
+    try:
+        mpz_get_str(buffer, 16, value)
+        return int(buffer.decode(), 16)
+    finally:
+        PyMem_Free(buffer)
+
+
+cdef void _set_infinity(mpz_t X, mpz_t Y, mpz_t Z) noexcept:
+    mpz_set_ui(X, 1)
+    mpz_set_ui(Y, 1)
+    mpz_set_ui(Z, 0)
+
+
+cdef void _jac_dbl(Context *c, mpz_t X, mpz_t Y, mpz_t Z) noexcept:
+    """Удвоение на месте, формулы dbl-1998-cmo-2
+    """
+    if mpz_sgn(Z) == 0:
+        return
+
+    if mpz_sgn(Y) == 0:
+        _set_infinity(X, Y, Z)
+        return
+
+    # t0 = XX, t1 = YY, t2 = ZZ
+    mpz_mul(c.t0, X, X)
+    mpz_mod(c.t0, c.t0, c.p)
+    mpz_mul(c.t1, Y, Y)
+    mpz_mod(c.t1, c.t1, c.p)
+    mpz_mul(c.t2, Z, Z)
+    mpz_mod(c.t2, c.t2, c.p)
+
+    # t3 = S = 4 * X * YY
+    mpz_mul(c.t3, X, c.t1)
+    mpz_mul_ui(c.t3, c.t3, 4)
+    mpz_mod(c.t3, c.t3, c.p)
+
+    # t4 = M = 3 * XX + a * ZZ^2
+    mpz_mul(c.t5, c.t2, c.t2)
+    mpz_mod(c.t5, c.t5, c.p)
+    mpz_mul(c.t5, c.t5, c.a)
+    mpz_mul_ui(c.t4, c.t0, 3)
+    mpz_add(c.t4, c.t4, c.t5)
+    mpz_mod(c.t4, c.t4, c.p)
+
+    # Z3 = 2 * Y * Z
+    mpz_mul(Z, Y, Z)
+    mpz_mul_ui(Z, Z, 2)
+    mpz_mod(Z, Z, c.p)
+
+    # X3 = M^2 - 2 * S
+    mpz_mul(c.t6, c.t4, c.t4)
+    mpz_sub(c.t6, c.t6, c.t3)
+    mpz_sub(c.t6, c.t6, c.t3)
+    mpz_mod(X, c.t6, c.p)
+
+    # Y3 = M * (S - X3) - 8 * YY^2
+    mpz_sub(c.t7, c.t3, X)
+    mpz_mul(c.t7, c.t7, c.t4)
+    mpz_mul(c.t5, c.t1, c.t1)
+    mpz_mul_ui(c.t5, c.t5, 8)
+    mpz_sub(c.t7, c.t7, c.t5)
+    mpz_mod(Y, c.t7, c.p)
+
+
+cdef void _jac_add(Context *c, mpz_t X1, mpz_t Y1, mpz_t Z1, mpz_t X2, mpz_t Y2, mpz_t Z2) noexcept:
+    """Сложение на месте (результат в первой точке), формулы add-1998-cmo-2
+    """
+    if mpz_sgn(Z2) == 0:
+        return
+
+    if mpz_sgn(Z1) == 0:
+        mpz_set(X1, X2)
+        mpz_set(Y1, Y2)
+        mpz_set(Z1, Z2)
+        return
+
+    # t0 = Z1Z1, t1 = Z2Z2
+    mpz_mul(c.t0, Z1, Z1)
+    mpz_mod(c.t0, c.t0, c.p)
+    mpz_mul(c.t1, Z2, Z2)
+    mpz_mod(c.t1, c.t1, c.p)
+
+    # t2 = U1 = X1 * Z2Z2, t3 = U2 = X2 * Z1Z1
+    mpz_mul(c.t2, X1, c.t1)
+    mpz_mod(c.t2, c.t2, c.p)
+    mpz_mul(c.t3, X2, c.t0)
+    mpz_mod(c.t3, c.t3, c.p)
+
+    # t4 = S1 = Y1 * Z2 * Z2Z2, t5 = S2 = Y2 * Z1 * Z1Z1
+    mpz_mul(c.t4, Y1, Z2)
+    mpz_mul(c.t4, c.t4, c.t1)
+    mpz_mod(c.t4, c.t4, c.p)
+    mpz_mul(c.t5, Y2, Z1)
+    mpz_mul(c.t5, c.t5, c.t0)
+    mpz_mod(c.t5, c.t5, c.p)
+
+    # t3 = H = U2 - U1, t5 = r = S2 - S1
+    mpz_sub(c.t3, c.t3, c.t2)
+    mpz_mod(c.t3, c.t3, c.p)
+    mpz_sub(c.t5, c.t5, c.t4)
+    mpz_mod(c.t5, c.t5, c.p)
+
+    if mpz_sgn(c.t3) == 0:
+        if mpz_sgn(c.t5) == 0:
+            _jac_dbl(c, X1, Y1, Z1)
+        else:
+            _set_infinity(X1, Y1, Z1)
+        return
+
+    # t0 = HH, t1 = HHH, t6 = V = U1 * HH
+    mpz_mul(c.t0, c.t3, c.t3)
+    mpz_mod(c.t0, c.t0, c.p)
+    mpz_mul(c.t1, c.t3, c.t0)
+    mpz_mod(c.t1, c.t1, c.p)
+    mpz_mul(c.t6, c.t2, c.t0)
+    mpz_mod(c.t6, c.t6, c.p)
+
+    # Z3 = Z1 * Z2 * H
+    mpz_mul(Z1, Z1, Z2)
+    mpz_mul(Z1, Z1, c.t3)
+    mpz_mod(Z1, Z1, c.p)
+
+    # X3 = r^2 - HHH - 2 * V
+    mpz_mul(c.t7, c.t5, c.t5)
+    mpz_sub(c.t7, c.t7, c.t1)
+    mpz_sub(c.t7, c.t7, c.t6)
+    mpz_sub(c.t7, c.t7, c.t6)
+    mpz_mod(X1, c.t7, c.p)
+
+    # Y3 = r * (V - X3) - S1 * HHH
+    mpz_sub(c.t7, c.t6, X1)
+    mpz_mul(c.t7, c.t7, c.t5)
+    mpz_mul(c.t2, c.t4, c.t1)
+    mpz_sub(c.t7, c.t7, c.t2)
+    mpz_mod(Y1, c.t7, c.p)
+
+
+cdef void _context_init(Context *c) noexcept:
+    mpz_init(c.a)
+    mpz_init(c.p)
+    mpz_init(c.t0)
+    mpz_init(c.t1)
+    mpz_init(c.t2)
+    mpz_init(c.t3)
+    mpz_init(c.t4)
+    mpz_init(c.t5)
+    mpz_init(c.t6)
+    mpz_init(c.t7)
+
+
+cdef void _context_clear(Context *c) noexcept:
+    mpz_clear(c.a)
+    mpz_clear(c.p)
+    mpz_clear(c.t0)
+    mpz_clear(c.t1)
+    mpz_clear(c.t2)
+    mpz_clear(c.t3)
+    mpz_clear(c.t4)
+    mpz_clear(c.t5)
+    mpz_clear(c.t6)
+    mpz_clear(c.t7)
+
+
+def scalar_mul_affine(x, y, scalar, a, p):
+    """Считает scalar * (x, y) на кривой y^2 = x^3 + ax + b над Z_p
+
+    Координаты и a должны быть приведены по модулю p, scalar неотрицателен.
+    Возвращает (x, y), бесконечно удаленная точка - (None, None).
+    """
+    cdef Context c
+    cdef mpz_t k, X, Y, Z, GX, GY, GZ
+    cdef Py_ssize_t i
+
+    if scalar < 0:
+        raise ValueError('Скаляр должен быть неотрицательным')
+
+    _context_init(&c)
+    mpz_init(k)
+    mpz_init(X)
+    mpz_init(Y)
+    mpz_init(Z)
+    mpz_init(GX)
+    mpz_init(GY)
+    mpz_init(GZ)
+
+    try:
+        _set_int(c.a, a)
+        _set_int(c.p, p)
+        _set_int(k, scalar)
+        _set_int(GX, x)
+        _set_int(GY, y)
+        mpz_set_ui(GZ, 1)
+        _set_infinity(X, Y, Z)
+
+        for i in reversed(range(scalar.bit_length())):
+            _jac_dbl(&c, X, Y, Z)
+            if mpz_tstbit(k, i):
+                _jac_add(&c, X, Y, Z, GX, GY, GZ)
+
+        if mpz_sgn(Z) == 0:
+            return None, None
+
+        # t0 = Z^-1, t1 = Z^-2
+        mpz_invert(c.t0, Z, c.p)
+        mpz_mul(c.t1, c.t0, c.t0)
+        mpz_mod(c.t1, c.t1, c.p)
+
+        mpz_mul(X, X, c.t1)
+        mpz_mod(X, X, c.p)
+        mpz_mul(Y, Y, c.t1)
+        mpz_mul(Y, Y, c.t0)
+        mpz_mod(Y, Y, c.p)
+
+        return _get_int(X), _get_int(Y)
+    finally:
+        mpz_clear(k)
+        mpz_clear(X)
+        mpz_clear(Y)
+        mpz_clear(Z)
+        mpz_clear(GX)
+        mpz_clear(GY)
+        mpz_clear(GZ)
+        _context_clear(&c)
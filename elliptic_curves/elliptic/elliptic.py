@@ -1,18 +1,119 @@
 from abc import ABCMeta, abstractmethod
+from array import array
 from dataclasses import dataclass
-from itertools import product
-from typing import Generic, Optional, Type, TypeVar
+from itertools import count, product
+from math import gcd
+from typing import (Callable, Dict, Generic, Iterator, List, Optional,
+                    Sequence, Tuple, Type, TypeVar, Union)
 
+from elliptic_curves.elliptic import _jit
 from elliptic_curves.elliptic.errors import (CalculationError, IncorrectOrder,
                                              InfinitePoint, NotOnCurve)
-from elliptic_curves.field import Field, GF2PolynomialField, ZpField
+from elliptic_curves.field import Field, GF2PolynomialField, is_probable_prime, ZpField
 from elliptic_curves.polynomial.polynomial import Polynomial
 
+try:
+    import numpy
+except ImportError:  # numpy - необязательная зависимость
+    numpy = None
+
+try:
+    from elliptic_curves.elliptic import _zp_fast
+except ImportError:  # C расширение не собрано
+    _zp_fast = None
+
 T = TypeVar('T')
 
+# Для поэлементной проверки в int64 произведение двух элементов поля не должно переполняться
+NUMPY_MAX_ORDER = 2 ** 31
+# До какой границы делители ищутся перебором, дальше - ро-методом Полларда
+TRIAL_DIVISION_BOUND = 2 ** 10
+
+
+def wnaf_digits(scalar: int, width: int) -> List[int]:
+    """Раскладывает скаляр в оконную несмежную форму (wNAF), младшие цифры идут первыми
+    """
+    digits = []
+    modulo = 1 << width
+    half = modulo >> 1
+
+    while scalar:
+        if scalar & 1:
+            digit = scalar & (modulo - 1)
+            if digit >= half:
+                digit -= modulo
+            scalar -= digit
+        else:
+            digit = 0
+
+        digits.append(digit)
+        scalar >>= 1
+
+    return digits
+
+
+def _isqrt(number: int) -> int:
+    """Целая часть квадратного корня методом Ньютона (math.isqrt есть только с python 3.8)
+    """
+    if number < 2:
+        return number
+
+    root = 1 << ((number.bit_length() + 1) // 2)
+    while True:
+        next_root = (root + number // root) // 2
+        if next_root >= root:
+            return root
+        root = next_root
+
+
+def prime_factors(number: int) -> Dict[int, int]:
+    """Раскладывает число на простые множители: {простое: степень}
+
+    Малые делители ищутся перебором, оставшиеся составные части делятся ро-методом Полларда.
+    """
+    factors = {}
+    divisor = 2
+
+    while divisor < TRIAL_DIVISION_BOUND and divisor * divisor <= number:
+        while number % divisor == 0:
+            factors[divisor] = factors.get(divisor, 0) + 1
+            number //= divisor
+        divisor += 1 if divisor == 2 else 2
+
+    parts = [number] if number > 1 else []
+    while parts:
+        part = parts.pop()
+        if is_probable_prime(part):
+            factors[part] = factors.get(part, 0) + 1
+        else:
+            divisor = _pollard_rho(part)
+            parts.extend((divisor, part // divisor))
+
+    return factors
+
+
+def _pollard_rho(number: int) -> int:
+    """Нетривиальный делитель составного числа ро-методом Полларда
+    """
+    for c in count(1):
+        x = y = 2
+        divisor = 1
+
+        while divisor == 1:
+            x = (x * x + c) % number
+            y = (y * y + c) % number
+            y = (y * y + c) % number
+            divisor = gcd(x - y, number)
+
+        if divisor != number:
+            return divisor
+
 
 @dataclass(unsafe_hash=True)
 class Point(Generic[T]):
+    # Без __dict__ у каждого экземпляра (dataclass(slots=True) доступен только с python 3.10)
+    __slots__ = ('x', 'y')
+
     x: Optional[T]
     y: Optional[T]
 
@@ -29,66 +130,234 @@ class Point(Generic[T]):
         return self.x == __o.x and self.y == __o.y
 
 
+# Внутреннее представление точки - кортеж координат
+RawPoint = Tuple[Optional[T], Optional[T]]
+INFINITY: RawPoint = (None, None)
+
+
+@dataclass(frozen=True)
+class PrecomputedTable(Generic[T]):
+    """Кратные точки из `Curve.precompute_base`: по 2^window - 1 точек на каждое окно
+    """
+    window: int
+    points: List[Point[T]]
+
+
 class Curve(Generic[T], metaclass=ABCMeta):
+    """Кривая над полем
+
+    Публичные методы принимают и возвращают `Point`, внутри же точки передаются
+    кортежами (x, y), бесконечно удаленная точка - (None, None).
+    """
+    # Начиная с какой длины скаляра (в битах) умножение идет через wNAF
+    WNAF_THRESHOLD = 16
+    WNAF_WIDTH = 4
+
     def __init__(self, field_order: T, field_cls: Type[Field[T]]):
         self._field: Field[T] = field_cls(field_order)
+        # Операции поля вызываются на каждом шаге сложения, связываем их заранее
+        self._mod = self._field.modulus
+        self._inv = self._field.invert
+        self._zero = self._field.zero()
 
     def add(self, first_point: Point[T], second_point: Point[T]) -> Point[T]:
-        if first_point.is_infinite():
+        if first_point.x is None:
             return second_point
 
-        if second_point.is_infinite():
+        if second_point.x is None:
             return first_point
 
+        first = (first_point.x, first_point.y)
+        second = first if second_point is first_point else (second_point.x, second_point.y)
+
+        return Point(*self._add_raw(first, second))
+
+    def double(self, point: Point[T]) -> Point[T]:
+        return Point(*self._double_raw((point.x, point.y)))
+
+    def mul(self, first_point: Point[T], scalar: int) -> Point[T]:
+        if scalar.bit_length() > self.WNAF_THRESHOLD:
+            return self.mul_wnaf(first_point, scalar, self.WNAF_WIDTH)
+
+        return Point(*self._mul_raw((first_point.x, first_point.y), scalar))
+
+    def mul_wnaf(self, first_point: Point[T], scalar: int, width: int = 4) -> Point[T]:
+        """Умножение точки на скаляр слева направо по wNAF представлению скаляра
+
+        Заранее считаются нечетные кратные точки P, 3P, ..., (2^(w-1) - 1)P,
+        отрицательные цифры берутся как обратные к ним точки.
+        """
+        add, double = self._add_raw, self._double_raw
+        table = self._wnaf_table((first_point.x, first_point.y), width)
+        result = INFINITY
+
+        for digit in reversed(wnaf_digits(scalar, width)):
+            result = double(result)
+
+            if digit > 0:
+                result = add(result, table[digit >> 1])
+            elif digit < 0:
+                result = add(result, self._negate_raw(table[-digit >> 1]))
+
+        return Point(*result)
+
+    def mul_ct(self, first_point: Point[T], scalar: int, bits: int) -> Point[T]:
+        """Умножение точки на скаляр лестницей Монтгомери
+
+        На каждом из `bits` шагов делается ровно одно сложение и одно удвоение,
+        поэтому число операций не зависит от веса Хэмминга скаляра. Число шагов
+        задается вызывающим и не должно выводиться из самого скаляра. Настоящего
+        постоянного времени в python не добиться (сравнения и длинная арифметика
+        зависят от данных), для этого нужно C расширение.
+        """
+        if not 0 <= scalar < 1 << bits:
+            raise ValueError(f'Скаляр не помещается в {bits} бит')
+
+        add, double = self._add_raw, self._double_raw
+        first, second = INFINITY, (first_point.x, first_point.y)
+
+        for i in reversed(range(bits)):
+            bit = (scalar >> i) & 1
+            first, second = (second, first) if bit else (first, second)
+            second = add(first, second)
+            first = double(first)
+            first, second = (second, first) if bit else (first, second)
+
+        return Point(*first)
+
+    def precompute_base(self, point: Point[T], bits: int, window: int = 1) -> PrecomputedTable[T]:
+        """Таблица кратных точки для многократного умножения одной и той же точки
+
+        Для каждого окна i из `ceil(bits / window)` хранятся j * 2^(window * i) * P,
+        j = 1..2^window - 1, строки идут подряд. При window=1 это просто
+        [P, 2P, 4P, ..., 2^(bits - 1)P].
+        """
+        add, double = self._add_raw, self._double_raw
+        row_size = (1 << window) - 1
+        base = (point.x, point.y)
+        table = []
+
+        for _ in range(-(-bits // window)):
+            multiple = base
+            table.append(multiple)
+
+            for _ in range(row_size - 1):
+                multiple = add(multiple, base)
+                table.append(multiple)
+
+            for _ in range(window):
+                base = double(base)
+
+        return PrecomputedTable(window, [Point(*multiple) for multiple in table])
+
+    def mul_with_table(self, table: PrecomputedTable[T], scalar: int) -> Point[T]:
+        """Умножение на скаляр по таблице из `precompute_base`: только сложения, без удвоений
+        """
+        window, points = table.window, table.points
+        row_size = (1 << window) - 1
+        if not 0 <= scalar < 1 << (window * (len(points) // row_size)):
+            raise ValueError('Скаляр не помещается в предпосчитанную таблицу')
+
+        add = self._add_raw
+        result = INFINITY
+        offset = -1
+
+        while scalar:
+            digit = scalar & row_size
+            if digit:
+                multiple = points[offset + digit]
+                result = add(result, (multiple.x, multiple.y))
+
+            scalar >>= window
+            offset += row_size
+
+        return Point(*result)
+
+    def negate(self, point: Point[T]) -> Point[T]:
+        """Возвращает обратную точку -P, такую что P + (-P) - бесконечно удаленная точка
+        """
+        return Point(*self._negate_raw((point.x, point.y)))
+
+    def _add_raw(self, first_point: RawPoint[T], second_point: RawPoint[T]) -> RawPoint[T]:
+        if first_point[0] is None:
+            return second_point
+
+        if second_point[0] is None:
+            return first_point
+
+        if first_point is second_point:
+            return self._double_raw(first_point)
+
+        if first_point[0] != second_point[0]:
+            k = self._first_case_coefficient(first_point, second_point)
+
+            return self._additive_point(first_point, second_point, coefficient=k)
+
+        if first_point[1] == second_point[1]:
+            return self._double_raw(first_point)
+
         try:
-            if first_point.x != second_point.x:
-                k = self._first_case_coefficient(first_point, second_point)
-            elif (
-                first_point.x == second_point.x and
-                first_point.y != second_point.y
-            ):
-                k = self._second_case_coefficient(first_point, second_point)
-            else:
-                k = self._third_case_coefficient(first_point, second_point)
+            k = self._second_case_coefficient(first_point, second_point)
         except InfinitePoint:
-            return Point.infinity()
+            return INFINITY
 
-        k = self._field.normalize_element(k)
-        result_point = self._additive_point(
-            first_point, second_point, coefficient=k)
-        result_point.x = self._field.normalize_element(result_point.x)
-        result_point.y = self._field.normalize_element(result_point.y)
+        return self._additive_point(first_point, second_point, coefficient=k)
 
-        return result_point
+    def _double_raw(self, point: RawPoint[T]) -> RawPoint[T]:
+        """Удвоение точки: всегда третий случай, без разбора случаев как в `_add_raw`
+        """
+        if point[0] is None:
+            return point
 
-    def mul(self, first_point: Point[T], scalar: int) -> Point[T]:
-        result = Point.infinity()
+        try:
+            k = self._third_case_coefficient(point, point)
+        except InfinitePoint:
+            return INFINITY
+
+        return self._additive_point(point, point, coefficient=k)
+
+    def _mul_raw(self, first_point: RawPoint[T], scalar: int) -> RawPoint[T]:
+        add, double = self._add_raw, self._double_raw
+        result = INFINITY
         addend = first_point
 
         while scalar:
             if scalar & 1:
-                result = self.add(result, addend)
+                result = addend if result[0] is None else add(result, addend)
 
-            addend = self.add(addend, addend)
+            addend = double(addend)
 
             scalar >>= 1
 
         return result
 
+    def _wnaf_table(self, point: RawPoint[T], width: int) -> List[RawPoint[T]]:
+        double_point = self._double_raw(point)
+        table = [point]
+
+        for _ in range((1 << (width - 2)) - 1):
+            table.append(self._add_raw(table[-1], double_point))
+
+        return table
+
+    @abstractmethod
+    def _negate_raw(self, point: RawPoint[T]) -> RawPoint[T]:
+        raise NotImplementedError
+
     @abstractmethod
-    def _first_case_coefficient(self, first_point: Point[T], second_point: Point[T]) -> T:
+    def _first_case_coefficient(self, first_point: RawPoint[T], second_point: RawPoint[T]) -> T:
         """Считает коэффициент для первого случая в случае если x1 == x2
         """
         raise NotImplementedError
 
     @abstractmethod
-    def _second_case_coefficient(self, first_point: Point[T], second_point: Point[T]) -> T:
+    def _second_case_coefficient(self, first_point: RawPoint[T], second_point: RawPoint[T]) -> T:
         """Считает коэффициент для первого случая в случае если x1 != x2 && y1 == y2
         """
         raise NotImplementedError
 
     @abstractmethod
-    def _third_case_coefficient(self, first_point: Point[T], second_point: Point[T]) -> T:
+    def _third_case_coefficient(self, first_point: RawPoint[T], second_point: RawPoint[T]) -> T:
         """Считает коэффициент для первого случая в случае если точки равны
             """
         raise NotImplementedError
@@ -96,71 +365,465 @@ class Curve(Generic[T], metaclass=ABCMeta):
     @abstractmethod
     def _additive_point(
         self,
-        first_point: Point[T],
-        second_point: Point[T],
+        first_point: RawPoint[T],
+        second_point: RawPoint[T],
         coefficient: T,
-    ) -> Point[T]:
+    ) -> RawPoint[T]:
         """Считает итоговую точку процесса "сложения" двух точек эллиптической кривой
+
+        Координаты результата должны быть уже приведены по модулю поля:
+        повторно они не нормализуются.
         """
         raise NotImplementedError
 
 
+# Шаблон специализированных под конкретную кривую сложения и удвоения, см. ZpCurve._compile_fast_ops
+_FAST_OPS_TEMPLATE = '''
+def add_fast(first_point, second_point):
+    x1, y1 = first_point
+    if x1 is None:
+        return second_point
+
+    x2, y2 = second_point
+    if x2 is None:
+        return first_point
+
+    if x1 != x2:
+        k = (y2 - y1) * invert(x2 - x1)
+        x3 = (k * k - x1 - x2) % {p}
+        return x3, (k * (x1 - x3) - y1) % {p}
+
+    if first_point is second_point or y1 == y2:
+        return double_fast(first_point)
+
+    return add_generic(first_point, second_point)
+
+
+def double_fast(point):
+    x, y = point
+    if x is None:
+        return point
+
+    if y % {p} == 0:
+        return INFINITY
+
+    k = (3 * x * x + {a}) * invert(2 * y)
+    x3 = (k * k - 2 * x) % {p}
+    return x3, (k * (x - x3) - y) % {p}
+'''
+
+
 class ZpCurve(Curve[int]):
+    # Бесконечно удаленная точка в координатах Якоби
+    _JACOBIAN_INFINITY = (1, 1, 0)
+    # Начиная с этого простого модуля порядок точки ищется шагами младенца-великана, а не подсчетом точек
+    BSGS_MIN_ORDER = 2 ** 10
+
     def __init__(self, p: int, a: int, b: int):
         self._a = a
         self._b = b
+        self._group_order: Optional[int] = None
         super().__init__(p, field_cls=ZpField)
+        self._add_raw, self._double_raw = self._compile_fast_ops()
 
-    def _first_case_coefficient(self, first_point: Point[int], second_point: Point[int]) -> int:
-        return self._field.modulus(
-            (second_point.y - first_point.y) *
-            self._field.invert(second_point.x - first_point.x),
-        )
+    def __getstate__(self) -> dict:
+        # Сгенерированные функции не сериализуются, при восстановлении они создаются заново
+        state = self.__dict__.copy()
+        del state['_add_raw'], state['_double_raw']
+
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._add_raw, self._double_raw = self._compile_fast_ops()
+
+    def _compile_fast_ops(self) -> Tuple[Callable, Callable]:
+        """Генерирует сложение и удвоение, в которые p и a подставлены константами
+
+        Первый случай сложения и удвоение считаются одной формулой: коэффициент
+        не приводится отдельно, на результат приходится по одному взятию остатка
+        на координату. Внутри функций не остается обращений к атрибутам кривой
+        и поля: модуль и коэффициент лежат в константах байткода, а обращение
+        элемента берется из глобального пространства имен функции.
+        """
+        source = _FAST_OPS_TEMPLATE.format(p=int(self._field._order), a=int(self._mod(self._a)))
+        namespace = {
+            'INFINITY': INFINITY,
+            'invert': self._inv,
+            'add_generic': super()._add_raw,
+        }
+        exec(compile(source, f'<{self.__class__.__name__} fast ops>', 'exec'), namespace)
 
-    def _second_case_coefficient(self, first_point: Point[int], second_point: Point[int]) -> int:  # noqa
-        if self._field.modulus(first_point.y + second_point.y) == self._field.zero():
+        return namespace['add_fast'], namespace['double_fast']
+
+    def _first_case_coefficient(self, first_point: RawPoint[int], second_point: RawPoint[int]) -> int:
+        x1, y1 = first_point
+        x2, y2 = second_point
+
+        return self._mod((y2 - y1) * self._inv(x2 - x1))
+
+    def _second_case_coefficient(self, first_point: RawPoint[int], second_point: RawPoint[int]) -> int:  # noqa
+        if self._mod(first_point[1] + second_point[1]) == self._zero:
             raise InfinitePoint
 
         raise ValueError(
             f'{self.__class__.__name__}: Невозможные условия для 2-го случая')
 
-    def _third_case_coefficient(self, first_point: Point[int], second_point: Point[int]) -> int:
-        return self._field.modulus(
-            (3 * first_point.x ** 2 + self._a) *
-            self._field.invert(2 * first_point.y),
-        )
+    def _third_case_coefficient(self, first_point: RawPoint[int], second_point: RawPoint[int]) -> int:
+        x1, y1 = first_point
+        if self._mod(2 * y1) == self._zero:
+            raise InfinitePoint
+
+        return self._mod((3 * x1 ** 2 + self._a) * self._inv(2 * y1))
 
     def _additive_point(
         self,
-        first_point: Point[int],
-        second_point: Point[int],
+        first_point: RawPoint[int],
+        second_point: RawPoint[int],
         coefficient: int,
-    ) -> Point[int]:
-        x3 = self._field.modulus(
-            coefficient ** 2 - first_point.x - second_point.x)
-        y3 = self._field.modulus(
-            first_point.y + coefficient * (x3 - first_point.x))
+    ) -> RawPoint[int]:
+        x1, y1 = first_point
+        x3 = self._mod(coefficient ** 2 - x1 - second_point[0])
+        y3 = self._mod(y1 + coefficient * (x3 - x1))
+
+        return x3, self._mod(-y3)
+
+    def _negate_raw(self, point: RawPoint[int]) -> RawPoint[int]:
+        if point[0] is None:
+            return point
+
+        return self._mod(point[0]), self._mod(-point[1])
+
+    def mul(self, first_point: Point[int], scalar: int) -> Point[int]:
+        if first_point.x is None:
+            return first_point
+
+        if (
+            _jit.NUMBA_AVAILABLE and
+            self._field._order < _jit.MAX_ORDER and
+            0 <= scalar <= _jit.MAX_SCALAR
+        ):
+            x, y = _jit.scalar_mul(
+                int(self._mod(first_point.x)),
+                int(self._mod(first_point.y)),
+                scalar,
+                int(self._mod(self._a)),
+                int(self._field._order),
+            )
+            if x == _jit.INFINITY:
+                return Point.infinity()
+
+            return Point(self._mod(x), self._mod(y))
+
+        if _zp_fast is not None and scalar >= 0:
+            x, y = _zp_fast.scalar_mul_affine(
+                int(self._mod(first_point.x)),
+                int(self._mod(first_point.y)),
+                scalar,
+                int(self._mod(self._a)),
+                int(self._field._order),
+            )
+            if x is None:
+                return Point.infinity()
+
+            return Point(self._mod(x), self._mod(y))
+
+        return self.mul_jac(first_point, scalar)
+
+    def mul_jac(self, first_point: Point[int], scalar: int) -> Point[int]:
+        """Умножение точки на скаляр в координатах Якоби (x = X/Z^2, y = Y/Z^3)
+
+        Внутри цикла не делается ни одного обращения, точка переводится обратно
+        в аффинные координаты одним обращением Z в конце.
+        """
+        if first_point.x is None:
+            return first_point
+
+        jac_add, jac_dbl = self._jac_add, self._jac_dbl
+        result = self._JACOBIAN_INFINITY
+        addend = (self._mod(first_point.x), self._mod(first_point.y), 1)
+
+        while scalar:
+            if scalar & 1:
+                result = jac_add(*result, *addend)
+
+            addend = jac_dbl(*addend)
+
+            scalar >>= 1
+
+        return Point(*self._from_jacobian(*result))
+
+    def _wnaf_table(self, point: RawPoint[int], width: int) -> List[RawPoint[int]]:
+        """Таблица нечетных кратных считается в координатах Якоби и приводится
+        к аффинным координатам одним пакетным обращением
+        """
+        if point[0] is None:
+            return [point] * (1 << (width - 2))
+
+        addend = (self._mod(point[0]), self._mod(point[1]), 1)
+        double_point = self._jac_dbl(*addend)
+        table = [addend]
 
-        return Point(x3, self._field.modulus(-y3))
+        for _ in range((1 << (width - 2)) - 1):
+            table.append(self._jac_add(*table[-1], *double_point))
+
+        return self._from_jacobian_batch(table)
+
+    def _from_jacobian_batch(self, points: List[Tuple[int, int, int]]) -> List[RawPoint[int]]:
+        z_invs = self._field.batch_invert([Z for _, _, Z in points])
+        result = []
+
+        for (X, Y, Z), z_inv in zip(points, z_invs):
+            if Z == 0:
+                result.append(INFINITY)
+                continue
+
+            z_inv_square = self._mod(z_inv * z_inv)
+            result.append((
+                self._mod(X * z_inv_square),
+                self._mod(Y * z_inv_square * z_inv),
+            ))
+
+        return result
+
+    def _from_jacobian(self, X: int, Y: int, Z: int) -> RawPoint[int]:
+        if Z == 0:
+            return INFINITY
+
+        z_inv = self._inv(Z)
+        z_inv_square = self._mod(z_inv * z_inv)
+
+        return (
+            self._mod(X * z_inv_square),
+            self._mod(Y * z_inv_square * z_inv),
+        )
+
+    def _jac_add(self, X1: int, Y1: int, Z1: int, X2: int, Y2: int, Z2: int) -> Tuple[int, int, int]:
+        """Сложение в координатах Якоби, формулы add-1998-cmo-2
+        """
+        if Z1 == 0:
+            return X2, Y2, Z2
+
+        if Z2 == 0:
+            return X1, Y1, Z1
+
+        mod = self._mod
+        Z1Z1 = mod(Z1 * Z1)
+        Z2Z2 = mod(Z2 * Z2)
+        U1 = mod(X1 * Z2Z2)
+        U2 = mod(X2 * Z1Z1)
+        S1 = mod(Y1 * Z2 * Z2Z2)
+        S2 = mod(Y2 * Z1 * Z1Z1)
+        H = mod(U2 - U1)
+        r = mod(S2 - S1)
+
+        if H == 0:
+            if r == 0:
+                return self._jac_dbl(X1, Y1, Z1)
+
+            return self._JACOBIAN_INFINITY
+
+        HH = mod(H * H)
+        HHH = mod(H * HH)
+        V = mod(U1 * HH)
+
+        X3 = mod(r * r - HHH - 2 * V)
+        Y3 = mod(r * (V - X3) - S1 * HHH)
+        Z3 = mod(Z1 * Z2 * H)
+
+        return X3, Y3, Z3
+
+    def _jac_dbl(self, X: int, Y: int, Z: int) -> Tuple[int, int, int]:
+        """Удвоение в координатах Якоби, формулы dbl-1998-cmo-2
+        """
+        if Z == 0 or Y == 0:
+            return self._JACOBIAN_INFINITY
+
+        mod = self._mod
+        XX = mod(X * X)
+        YY = mod(Y * Y)
+        ZZ = mod(Z * Z)
+        S = mod(4 * X * YY)
+        M = mod(3 * XX + self._a * ZZ * ZZ)
+
+        X3 = mod(M * M - 2 * S)
+        Y3 = mod(M * (S - X3) - 8 * YY * YY)
+        Z3 = mod(2 * Y * Z)
+
+        return X3, Y3, Z3
 
     def is_on_curve(self, point: Point[int]) -> bool:
-        return point.is_infinite() or (self._field.modulus(point.y**2) ==
-                                       self._field.modulus(point.x**3 + self._a*point.x + self._b))
+        return point.x is None or (self._mod(point.y**2) ==
+                                   self._mod(point.x**3 + self._a*point.x + self._b))
+
+    def are_on_curve(self, xs: Sequence[int], ys: Sequence[int]) -> Sequence[bool]:
+        """Проверяет сразу много точек, заданных столбцами координат
+
+        С numpy (и модулем меньше NUMPY_MAX_ORDER) проверка идет векторно в int64
+        и возвращается массив numpy.bool_, иначе - список bool.
+        """
+        p = self._field._order
+        if numpy is None or p >= NUMPY_MAX_ORDER:
+            return [self.is_on_curve(Point(x, y)) for x, y in zip(xs, ys)]
+
+        p = int(p)
+        xs = self._reduced_column(xs, p)
+        ys = self._reduced_column(ys, p)
+
+        lhs = ys * ys % p
+        rhs = (xs * xs % p * xs % p + int(self._mod(self._a)) * xs % p + int(self._mod(self._b))) % p
+
+        return lhs == rhs
+
+    @staticmethod
+    def _reduced_column(values: Sequence[int], p: int) -> 'numpy.ndarray':
+        """Столбец координат, приведенных по модулю p, в виде массива int64
+
+        Массивы и списки целых, помещающихся в int64, приводятся векторно, остальное
+        (длинные int, gmpy2.mpz) - поэлементно до перевода в int64.
+        """
+        column = numpy.asarray(values)
+        if column.dtype.kind == 'i':
+            return column.astype(numpy.int64, copy=False) % p
+
+        return numpy.array([int(value) % p for value in values], dtype=numpy.int64)
+
+    def is_on_curve_batch(self, points: Sequence[Point[int]]) -> List[bool]:
+        """Проверяет сразу много точек, бесконечно удаленная точка лежит на кривой
+
+        Один цикл без вызовов `is_on_curve` на каждую точку. Столбцы для numpy
+        пришлось бы собирать из тех же python объектов, так что векторная
+        проверка здесь не быстрее, для столбцов координат есть `are_on_curve`.
+        """
+        p = self._field._order
+        a, b = self._mod(self._a), self._mod(self._b)
+
+        return [point.x is None or (point.y * point.y - (point.x * point.x + a) * point.x - b) % p == 0
+                for point in points]
 
     def all_points(self) -> Point[int]:
-        for x, y in product(range(self._field._order), repeat=2):
-            point = Point(x, y)
-            if self.is_on_curve(point):
-                yield point
+        for x, y in self._affine_points():
+            yield Point(x, y)
         yield Point.infinity()
 
+    def all_points_arrays(self) -> Tuple[Union[array, 'numpy.ndarray'], Union[array, 'numpy.ndarray']]:
+        """Все аффинные точки кривой двумя столбцами координат (без бесконечно удаленной)
+
+        Столбцы - массивы int64 (numpy.ndarray, если установлен numpy, иначе array.array):
+        16 байт на точку вместо отдельного объекта `Point` на каждую.
+        """
+        xs, ys = array('q'), array('q')
+
+        for x, y in self._affine_points():
+            xs.append(x)
+            ys.append(y)
+
+        if numpy is not None:
+            return numpy.frombuffer(xs, dtype=numpy.int64), numpy.frombuffer(ys, dtype=numpy.int64)
+
+        return xs, ys
+
+    def _affine_points(self) -> Iterator[RawPoint[int]]:
+        if not self._field._is_prime:
+            # По составному модулю корни не ищутся Тонелли-Шенксом, перебираем все пары
+            for x, y in product(range(self._field._order), repeat=2):
+                if self.is_on_curve(Point(x, y)):
+                    yield x, y
+            return
+
+        for x in range(self._field._order):
+            root = self._field.sqrt(x ** 3 + self._a * x + self._b)
+            if root is None:
+                continue
+
+            for y in sorted({root, self._mod(-root)}):
+                yield x, y
+
+    def group_order(self) -> int:
+        """Число точек кривой (вместе с бесконечно удаленной), считается один раз
+
+        Для каждого x по критерию Эйлера определяется, сколько y ему соответствует.
+        Критерий верен только для нечетного простого модуля, иначе точки перебираются.
+        """
+        if self._group_order is None:
+            p = self._field._order
+            order = 1
+
+            if p == 2 or not self._field._is_prime:
+                order += sum(1 for _ in self._affine_points())
+            else:
+                for x in range(p):
+                    rhs = self._mod(x ** 3 + self._a * x + self._b)
+                    if rhs == 0:
+                        order += 1
+                    elif pow(rhs, (p - 1) // 2, p) == 1:
+                        order += 2
+
+            self._group_order = order
+
+        return self._group_order
+
     def point_order(self, point: Point[int]) -> int:
-        n = 2
-        if (point == Point.infinity()):
+        """Порядок точки делит любое m, для которого mP = O, поэтому из m
+        выкидываются лишние простые множители
+
+        Для большого простого модуля m ищется шагами младенца-великана,
+        для малого или составного - берется порядок группы.
+        """
+        if point.x is None:
             raise InfinitePoint("Passed point must be not infinite!")
         if not self.is_on_curve(point):
             raise NotOnCurve("Passed point must be on curve!")
-        while self.mul(point, n) != Point.infinity() and n <= self._field._order:
+
+        if self._field._is_prime and self._field._order >= self.BSGS_MIN_ORDER:
+            order = self._order_multiple_bsgs(point)
+        else:
+            order = self.group_order()
+            if self.mul(point, order).x is not None:
+                return self._point_order_linear(point)
+
+        for prime in prime_factors(order):
+            while order % prime == 0 and self.mul(point, order // prime).x is None:
+                order //= prime
+
+        return order
+
+    def _order_multiple_bsgs(self, point: Point[int]) -> int:
+        """Ищет m из интервала Хассе [p + 1 - 2√p, p + 1 + 2√p], для которого mP = O
+
+        Порядок группы лежит в этом интервале, поэтому m всегда найдется.
+        Шагами младенца-великана на это уходит O(p^(1/4)) сложений.
+        """
+        p = int(self._field._order)
+        width = _isqrt(4 * p)
+        low = p + 1 - width
+        steps = _isqrt(2 * width) + 1
+
+        add = self._add_raw
+        base = (self._mod(point.x), self._mod(point.y))
+
+        # Шаги младенца: rP -> r для r < steps
+        baby_steps = {}
+        multiple = INFINITY
+        for r in range(steps):
+            baby_steps.setdefault(multiple, r)
+            multiple = add(multiple, base)
+
+        # Шаги великана: (low + i * steps)P + rP = O, то есть rP = -(low + i * steps)P
+        giant_step = multiple
+        current = self._mul_raw(base, low)
+        for i in range(steps):
+            r = baby_steps.get(self._negate_raw(current))
+            if r is not None:
+                return low + i * steps + r
+
+            current = add(current, giant_step)
+
+        raise IncorrectOrder("Can not get the order of the point!")
+
+    def _point_order_linear(self, point: Point[int]) -> int:
+        n = 2
+        while self.mul(point, n).x is not None and n <= self._field._order:
             n += 1
         if (n > self._field._order):
             raise IncorrectOrder("Can not get the order of the point!")
@@ -179,22 +842,30 @@ class GF2CurveBase(Curve[Polynomial], metaclass=ABCMeta):
 
 
 class GF2NotSupersingularCurve(GF2CurveBase):
+    def _negate_raw(self, point: RawPoint[Polynomial]) -> RawPoint[Polynomial]:
+        x, y = point
+        if x is None:
+            return point
+
+        return x, self._mod(self._a * x + y)
+
     def _first_case_coefficient(
         self,
-        first_point: Point[Polynomial],
-        second_point: Point[Polynomial],
+        first_point: RawPoint[Polynomial],
+        second_point: RawPoint[Polynomial],
     ) -> Polynomial:
-        return self._field.modulus(
-            (first_point.y + second_point.y) *
-            self._field.invert(first_point.x + second_point.x),
-        )
+        x1, y1 = first_point
+        x2, y2 = second_point
+
+        return self._mod((y1 + y2) * self._inv(x1 + x2))
 
     def _second_case_coefficient(
         self,
-        first_point: Point[Polynomial],
-        second_point: Point[Polynomial],
+        first_point: RawPoint[Polynomial],
+        second_point: RawPoint[Polynomial],
     ) -> Polynomial:  # noqa
-        if self._field.modulus(second_point.y) == self._field.modulus(self._a * first_point.x + first_point.y):
+        x1, y1 = first_point
+        if self._mod(second_point[1]) == self._mod(self._a * x1 + y1):
             raise InfinitePoint
 
         raise CalculationError(
@@ -202,47 +873,58 @@ class GF2NotSupersingularCurve(GF2CurveBase):
 
     def _third_case_coefficient(
         self,
-        first_point: Point[Polynomial],
-        second_point: Point[Polynomial],
+        first_point: RawPoint[Polynomial],
+        second_point: RawPoint[Polynomial],
     ) -> Polynomial:
-        return self._field.modulus(
-            (first_point.x * first_point.x + self._a * first_point.y) *
-            self._field.invert((self._a * first_point.x)),
+        x1, y1 = first_point
+        if self._mod(self._a * x1) == self._zero:
+            raise InfinitePoint
+
+        return self._mod(
+            (x1 * x1 + self._a * y1) *
+            self._inv((self._a * x1)),
         )
 
     def _additive_point(
         self,
-        first_point: Point[Polynomial],
-        second_point: Point[Polynomial],
+        first_point: RawPoint[Polynomial],
+        second_point: RawPoint[Polynomial],
         coefficient: Polynomial,
-    ) -> Point[Polynomial]:
-        x3 = self._field.modulus(
+    ) -> RawPoint[Polynomial]:
+        x1, y1 = first_point
+        x3 = self._mod(
             coefficient * coefficient + self._a * coefficient +
-            self._b + first_point.x + second_point.x,
+            self._b + x1 + second_point[0],
         )
-        y3 = self._field.modulus(
-            first_point.y + coefficient * (x3 + first_point.x))
+        y3 = self._mod(y1 + coefficient * (x3 + x1))
 
-        return Point(x3, self._field.modulus(self._a * x3 + y3))
+        return x3, self._mod(self._a * x3 + y3)
 
 
 class GF2SupersingularCurve(GF2CurveBase):
+    def _negate_raw(self, point: RawPoint[Polynomial]) -> RawPoint[Polynomial]:
+        x, y = point
+        if x is None:
+            return point
+
+        return x, self._mod(self._a + y)
+
     def _first_case_coefficient(
         self,
-        first_point: Point[Polynomial],
-        second_point: Point[Polynomial],
+        first_point: RawPoint[Polynomial],
+        second_point: RawPoint[Polynomial],
     ) -> Polynomial:
-        return self._field.modulus(
-            (first_point.y + second_point.y) *
-            self._field.invert(first_point.x + second_point.x),
-        )
+        x1, y1 = first_point
+        x2, y2 = second_point
+
+        return self._mod((y1 + y2) * self._inv(x1 + x2))
 
     def _second_case_coefficient(
         self,
-        first_point: Point[Polynomial],
-        second_point: Point[Polynomial],
+        first_point: RawPoint[Polynomial],
+        second_point: RawPoint[Polynomial],
     ) -> Polynomial:  # noqa
-        if self._field.modulus(second_point.y) == self._field.modulus(self._a + first_point.y):
+        if self._mod(second_point[1]) == self._mod(self._a + first_point[1]):
             raise InfinitePoint
 
         raise CalculationError(
@@ -250,27 +932,29 @@ class GF2SupersingularCurve(GF2CurveBase):
 
     def _third_case_coefficient(
         self,
-        first_point: Point[Polynomial],
-        second_point: Point[Polynomial],
+        first_point: RawPoint[Polynomial],
+        second_point: RawPoint[Polynomial],
     ) -> Polynomial:
-        if self._field.modulus(self._a) == self._field.zero():
+        if self._mod(self._a) == self._zero:
             raise CalculationError('Коэффиициент a не может быть 0')
 
-        return self._field.modulus(
-            (first_point.x * first_point.x + self._b) *
-            self._field.invert(self._a),
+        x1 = first_point[0]
+
+        return self._mod(
+            (x1 * x1 + self._b) *
+            self._inv(self._a),
         )
 
     def _additive_point(
         self,
-        first_point: Point[Polynomial],
-        second_point: Point[Polynomial],
+        first_point: RawPoint[Polynomial],
+        second_point: RawPoint[Polynomial],
         coefficient: Polynomial,
-    ) -> Point[Polynomial]:
-        x3 = self._field.modulus(
-            coefficient * coefficient + first_point.x + second_point.x,
+    ) -> RawPoint[Polynomial]:
+        x1, y1 = first_point
+        x3 = self._mod(
+            coefficient * coefficient + x1 + second_point[0],
         )
-        y3 = self._field.modulus(
-            first_point.y + coefficient * (x3 + first_point.x))
+        y3 = self._mod(y1 + coefficient * (x3 + x1))
 
-        return Point(x3, self._field.modulus(self._a + y3))
+        return x3, self._mod(self._a + y3)
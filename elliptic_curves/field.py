@@ -1,11 +1,51 @@
+import sys
 from abc import ABCMeta, abstractmethod
 from copy import deepcopy
-from typing import Generic, Optional, TypeVar
+from typing import Generic, List, Optional, Sequence, TypeVar
 
 from elliptic_curves.polynomial.polynomial import Polynomial, polyone, polyzero
 
+try:
+    import gmpy2
+except ImportError:  # gmpy2 - необязательная зависимость, без нее работаем на int
+    gmpy2 = None
+
 T = TypeVar('T')
 
+# pow(x, -1, m) появился в python 3.8
+_POW_INVERSE = sys.version_info >= (3, 8)
+
+# Базы Миллера-Рабина: для чисел меньше 3.3 * 10^24 тест детерминирован
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+def is_probable_prime(number: int) -> bool:
+    if number < 2:
+        return False
+
+    for base in _MILLER_RABIN_BASES:
+        if number % base == 0:
+            return number == base
+
+    d, s = number - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+
+    for base in _MILLER_RABIN_BASES:
+        x = pow(base, d, number)
+        if x == 1 or x == number - 1:
+            continue
+
+        for _ in range(s - 1):
+            x = x * x % number
+            if x == number - 1:
+                break
+        else:
+            return False
+
+    return True
+
 
 class Field(Generic[T], metaclass=ABCMeta):
     def __init__(self, order: T, char: Optional[int] = None):
@@ -24,6 +64,34 @@ class Field(Generic[T], metaclass=ABCMeta):
 
         return self.modulus(prev_s)
 
+    def batch_invert(self, elements: Sequence[T]) -> List[T]:
+        """Обращает сразу несколько элементов трюком Монтгомери: одно обращение и 3n умножений
+
+        Нулевые элементы не обратимы, для них возвращается ноль.
+        """
+        zero = self.zero()
+        elements = [self.modulus(element) for element in elements]
+        prefixes = []
+        accumulator = self.one()
+
+        for element in elements:
+            prefixes.append(accumulator)
+            if element != zero:
+                accumulator = self.modulus(accumulator * element)
+
+        inverted = self.invert(accumulator)
+        result = [zero] * len(elements)
+
+        for index in reversed(range(len(elements))):
+            element = elements[index]
+            if element == zero:
+                continue
+
+            result[index] = self.modulus(inverted * prefixes[index])
+            inverted = self.modulus(inverted * element)
+
+        return result
+
     def modulus(self, element: T) -> T:
         return element % self._order
 
@@ -42,8 +110,81 @@ class Field(Generic[T], metaclass=ABCMeta):
 
 
 class ZpField(Field[int]):
+    """Кольцо вычетов по модулю
+
+    Если установлен gmpy2, элементы хранятся как gmpy2.mpz: арифметика GMP
+    заметно быстрее встроенной длинной арифметики на больших модулях.
+    """
     def __init__(self, order: int):
+        if gmpy2 is not None:
+            order = gmpy2.mpz(order)
+
         super().__init__(order, order)
+        self._is_prime = is_probable_prime(order)
+
+    def invert(self, element: int) -> int:
+        """Обращение встроенным pow(x, -1, p): расширенный алгоритм Евклида на C
+
+        На python 3.7 и для необратимых элементов - расширенный алгоритм Евклида.
+        С gmpy2 обращение делает GMP.
+        """
+        if gmpy2 is not None:
+            try:
+                return gmpy2.invert(element, self._order)
+            except ZeroDivisionError:  # элемент необратим
+                return super().invert(element)
+
+        if _POW_INVERSE:
+            try:
+                return pow(element, -1, self._order)
+            except ValueError:  # элемент необратим
+                pass
+
+        return super().invert(element)
+
+    def sqrt(self, element: int) -> Optional[int]:
+        """Квадратный корень по простому модулю (алгоритм Тонелли-Шенкса)
+
+        Возвращает один из корней либо None, если элемент не квадратичный вычет.
+        Для составного модуля алгоритм неприменим, бросается ValueError.
+        """
+        if not self._is_prime:
+            raise ValueError('Квадратный корень считается только по простому модулю')
+
+        p = self._order
+        element = self.modulus(element)
+
+        if element == 0 or p == 2:
+            return element
+
+        if pow(element, (p - 1) // 2, p) != 1:
+            return None
+
+        if p % 4 == 3:
+            return pow(element, (p + 1) // 4, p)
+
+        q, s = p - 1, 0
+        while q % 2 == 0:
+            q //= 2
+            s += 1
+
+        z = 2
+        while pow(z, (p - 1) // 2, p) != p - 1:
+            z += 1
+
+        m, c, t, root = s, pow(z, q, p), pow(element, q, p), pow(element, (q + 1) // 2, p)
+
+        while t != 1:
+            i, t_square = 0, t
+            while t_square != 1:
+                t_square = t_square * t_square % p
+                i += 1
+
+            b = pow(c, 1 << (m - i - 1), p)
+            m, c = i, b * b % p
+            t, root = t * c % p, root * b % p
+
+        return root
 
     @classmethod
     def zero(cls) -> int:
@@ -4,6 +4,7 @@ from typing import Any
 from typing import Dict
 from typing import Generic
 from typing import get_args
+from typing import Optional
 from typing import Type
 from typing import TypeVar
 
@@ -34,8 +35,8 @@ class FormattersRegistry:
     def __init__(self):
         self._registry = {}
 
-    def register(self, formatter: Formatter):
-        generic_type = _get_generic_type(formatter)
+    def register(self, formatter: Formatter, type_: Optional[Type] = None):
+        generic_type = type_ or _get_generic_type(formatter)
         self._registry[generic_type] = formatter
 
     def get(self, type_: Type):
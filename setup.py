@@ -3,7 +3,8 @@ import os
 from importlib.machinery import SourceFileLoader
 
 from pkg_resources import parse_requirements
-from setuptools import find_packages, setup
+from setuptools import Extension, find_packages, setup
+from setuptools.command.build_ext import build_ext
 
 project_name = 'elliptic-curve'
 module_name = 'elliptic_curves'
@@ -28,6 +29,41 @@ def load_requirements(*filenames: str) -> list:
                 yield '{}{}{}'.format(req.name, extras, req.specifier)
 
 
+class OptionalBuildExt(build_ext):
+    """Сборка C расширений необязательна: без компилятора или libgmp
+    пакет работает на чистом python"""
+
+    def run(self):
+        try:
+            super().run()
+        except Exception as error:
+            self.warn(f'Не удалось собрать C расширения: {error}')
+
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except Exception as error:
+            self.warn(f'Не удалось собрать расширение {ext.name}: {error}')
+
+
+def load_extensions() -> list:
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        return []
+
+    return cythonize(
+        [
+            Extension(
+                '{}.elliptic._zp_fast'.format(module_name),
+                sources=[os.path.join(module_name, 'elliptic', '_zp_fast.pyx')],
+                libraries=['gmp'],
+            ),
+        ],
+        language_level=3,
+    )
+
+
 setup(
     name=project_name,
     version='0.1.2',
@@ -50,6 +86,9 @@ setup(
     python_requires='>=3.7',
     packages=find_packages(exclude=['tests']),
     extras_require={
+        'jit': ['numba'],
+        'gmp': ['gmpy2'],
+        'numpy': ['numpy'],
         'dev': list(
             load_requirements(
                 'requirements-dev.txt',
@@ -63,4 +102,6 @@ setup(
         ],
     },
     include_package_data=True,
+    ext_modules=load_extensions(),
+    cmdclass={'build_ext': OptionalBuildExt},
 )
@@ -1,8 +1,14 @@
+import copy
+import pickle
+
 import pytest
 
-from elliptic_curves.elliptic.elliptic import (GF2NotSupersingularCurve,
+from elliptic_curves.elliptic import _jit
+from elliptic_curves.elliptic.elliptic import (Curve,
+                                               GF2NotSupersingularCurve,
                                                GF2SupersingularCurve, Point,
-                                               ZpCurve)
+                                               ZpCurve, prime_factors,
+                                               wnaf_digits)
 from elliptic_curves.polynomial.polynomial import Polynomial, polyone, polyzero
 
 
@@ -23,12 +29,26 @@ def pzero() -> Polynomial:
         (Point(1, 2), Point(2, 1), Point(1, 1)),
         (Point(1, 2), Point(1, 2), Point(2, 2)),
         (Point(1, 0), Point(2, 0), Point(0, 0)),
+        (Point(1, 0), Point(1, 0), Point.infinity()),
     ],
 )
 def test_zp_curve__add(zp_curve, first_point, second_point, result):
     assert zp_curve.add(first_point, second_point) == result
 
 
+@pytest.mark.parametrize(
+    'point, result',
+    [
+        (Point(None, None), Point(None, None)),
+        (Point(1, 2), Point(2, 2)),
+        (Point(1, 0), Point.infinity()),
+    ],
+)
+def test_zp_curve__double(zp_curve, point, result):
+    assert zp_curve.double(point) == result
+    assert zp_curve.add(point, point) == result
+
+
 @pytest.mark.parametrize(
     'point, result',
     [
@@ -45,11 +65,157 @@ def test_zp_curve__all_points(zp_curve: ZpCurve):
     assert list(zp_curve.all_points()) == [Point(0, 0), Point(1, 0), Point(2, 0), Point[int].infinity()]
 
 
+@pytest.mark.parametrize('p, a, b', [
+    (2, 1, 1), (5, 1, 1), (13, 2, 3), (17, -1, 3), (97, 2, 3), (8, 1, 1), (9, 1, 1), (15, 1, 1), (25, 1, 1),
+])
+def test_zp_curve__all_points_brute_force(p, a, b):
+    curve = ZpCurve(p, a, b)
+    expected = [Point(x, y) for x in range(p) for y in range(p) if curve.is_on_curve(Point(x, y))]
+
+    assert list(curve.all_points()) == expected + [Point.infinity()]
+
+
+@pytest.mark.parametrize('p, a, b', [(2, 1, 1), (13, 2, 3), (97, 2, 3)])
+def test_zp_curve__all_points_arrays(p, a, b):
+    curve = ZpCurve(p, a, b)
+    xs, ys = curve.all_points_arrays()
+
+    assert [Point(x, y) for x, y in zip(xs, ys)] == list(curve.all_points())[:-1]
+    assert all(curve.are_on_curve(xs, ys))
+
+
+def test_zp_curve__are_on_curve():
+    curve = ZpCurve(97, 2, 3)
+    xs = [3, 3, 0, 0, -94, 1]
+    ys = [6, 91, 10, 11, 6, 1]
+
+    assert list(curve.are_on_curve(xs, ys)) == [True, True, True, False, True, False]
+
+
+def test_zp_curve__are_on_curve_numpy_columns():
+    numpy = pytest.importorskip('numpy')
+    curve = ZpCurve(97, 2, 3)
+    xs = numpy.array([3, 3, 0, 0, -94, 1], dtype=numpy.int32)
+    ys = numpy.array([6, 91, 10, 11, 6, 1], dtype=numpy.int32)
+
+    assert list(curve.are_on_curve(xs, ys)) == [True, True, True, False, True, False]
+
+
+@pytest.mark.parametrize('point', [Point(3, 6), Point.infinity(), Point(Polynomial([0., 1.]), Polynomial([1.]))])
+def test_point__copy_and_pickle(point):
+    assert not hasattr(point, '__dict__')
+    assert copy.copy(point) == point
+    assert copy.deepcopy(point) == point
+    assert pickle.loads(pickle.dumps(point)) == point
+
+
+@pytest.mark.parametrize('clone', [copy.deepcopy, lambda curve: pickle.loads(pickle.dumps(curve))])
+def test_zp_curve__copy_and_pickle(clone):
+    curve = ZpCurve(97, 2, 3)
+    cloned = clone(curve)
+
+    assert cloned._add_raw.__globals__['invert'].__self__ is cloned._field
+    assert cloned.add(Point(3, 6), Point(0, 10)) == curve.add(Point(3, 6), Point(0, 10))
+    assert cloned.mul(Point(3, 6), 12345) == curve.mul(Point(3, 6), 12345)
+
+
+def test_point__hash():
+    assert hash(pickle.loads(pickle.dumps(Point(3, 6)))) == hash(Point(3, 6))
+    assert len({Point(3, 6), Point(3, 6), Point.infinity()}) == 2
+
+
+@pytest.mark.parametrize('p', [97, 2 ** 255 - 19])
+def test_zp_curve__is_on_curve_batch(p):
+    curve = ZpCurve(p, 2, 3)
+    points = [Point(3, 6), Point.infinity(), Point(0, 11), Point(-94, 6), Point(1, 1)]
+
+    assert curve.is_on_curve_batch(points) == [curve.is_on_curve(point) for point in points]
+    assert curve.is_on_curve_batch([]) == []
+
+
+def test_zp_curve__batch_checks_unreduced_coordinates():
+    curve = ZpCurve(97, 2, 3)
+    points = [Point(3 + 97 * 2 ** 70, 6), Point(-94 - 97 * 2 ** 70, 6 + 97 * 2 ** 64), Point(2 ** 80, 1)]
+
+    assert curve.is_on_curve_batch(points) == [curve.is_on_curve(point) for point in points] == [True, True, False]
+    assert list(curve.are_on_curve([point.x for point in points], [point.y for point in points])) == [True, True, False]
+
+
 def test_zp_curve__point_order():
     curve = ZpCurve(97, 2, 3)
     assert curve.point_order(Point(3, 6)) == 5
 
 
+@pytest.mark.parametrize('p, a, b', [(5, 1, 1), (13, 2, 3), (17, -1, 3), (97, 2, 3)])
+def test_zp_curve__compiled_ops_match_generic(p, a, b):
+    curve = ZpCurve(p, a, b)
+    points = [(point.x, point.y) for point in curve.all_points()]
+
+    for first in points:
+        assert curve._double_raw(first) == Curve._double_raw(curve, first)
+
+        for second in points:
+            assert curve._add_raw(first, second) == Curve._add_raw(curve, first, second)
+
+
+@pytest.mark.parametrize('p, a, b', [(2, 1, 1), (5, 1, 1), (13, 2, 3), (17, -1, 3), (97, 2, 3), (8, 1, 1), (15, 1, 1)])
+def test_zp_curve__group_order(p, a, b):
+    curve = ZpCurve(p, a, b)
+
+    assert curve.group_order() == len(list(curve.all_points()))
+
+
+@pytest.mark.parametrize('p, a, b', [(5, 1, 1), (13, 2, 3), (17, -1, 3), (97, 2, 3)])
+def test_zp_curve__point_order_matches_linear_search(p, a, b):
+    curve = ZpCurve(p, a, b)
+
+    for point in curve.all_points():
+        if point.is_infinite():
+            continue
+
+        expected = 2
+        while not curve.mul(point, expected).is_infinite():
+            expected += 1
+
+        assert curve.point_order(point) == expected
+
+
+@pytest.mark.parametrize('p, a, b', [(1031, 2, 3), (2003, -1, 3)])
+def test_zp_curve__point_order_bsgs_matches_group_order(monkeypatch, p, a, b):
+    curve = ZpCurve(p, a, b)
+    points = list(curve.all_points())[:-1:7]
+    bsgs_orders = [curve.point_order(point) for point in points]
+
+    monkeypatch.setattr(ZpCurve, 'BSGS_MIN_ORDER', p + 1)
+    assert bsgs_orders == [curve.point_order(point) for point in points]
+
+
+def test_zp_curve__point_order_large_prime():
+    curve = ZpCurve(2 ** 61 - 1, 2, 3)
+    point = Point(3, 6)
+    order = curve.point_order(point)
+
+    assert curve.mul(point, order).is_infinite()
+    for prime in prime_factors(order):
+        assert not curve.mul(point, order // prime).is_infinite()
+
+
+@pytest.mark.parametrize(
+    'number, factors',
+    [
+        (1, {}),
+        (2, {2: 1}),
+        (100, {2: 2, 5: 2}),
+        (97, {97: 1}),
+        (2 * 3 ** 4 * 101, {2: 1, 3: 4, 101: 1}),
+        (1000003 ** 2, {1000003: 2}),
+        (12 * (2 ** 31 - 1) * (2 ** 61 - 1), {2: 2, 3: 1, 2 ** 31 - 1: 1, 2 ** 61 - 1: 1}),
+    ],
+)
+def test_prime_factors(number, factors):
+    assert prime_factors(number) == factors
+
+
 @pytest.mark.parametrize(
     'first_point, scalar, result',
     [
@@ -61,6 +227,130 @@ def test_zp_curve__mul(zp_curve, first_point, scalar, result):
     assert zp_curve.mul(first_point, scalar) == result
 
 
+@pytest.mark.parametrize('scalar', [0, 1, 2, 5, 7, 42, 100])
+def test_zp_curve__jit_scalar_mul(scalar):
+    curve = ZpCurve(97, 2, 3)
+    expected = Curve.mul(curve, Point(3, 6), scalar)
+
+    x, y = _jit.scalar_mul(3, 6, scalar, 2, 97)
+    actual = Point.infinity() if x == _jit.INFINITY else Point(x, y)
+
+    assert actual == expected
+
+
+def test_zp_curve__mul_uses_jit(monkeypatch):
+    monkeypatch.setattr(_jit, 'NUMBA_AVAILABLE', True)
+    curve = ZpCurve(97, 2, 3)
+
+    assert curve.mul(Point(3, 6), 5) == Point.infinity()
+    assert curve.mul(Point(3, 6), 7) == Curve.mul(curve, Point(3, 6), 7)
+    assert type(curve.mul(Point(3, 6), 7).x) is type(curve.mul_jac(Point(3, 6), 7).x)
+
+
+@pytest.mark.parametrize('point', [Point(3, 6), Point(0, 10), Point(17, 10)])
+@pytest.mark.parametrize('scalar', [0, 1, 2, 3, 4, 5, 6, 11, 97, 2 ** 20 + 3])
+def test_zp_curve__mul_jac(point, scalar):
+    curve = ZpCurve(97, 2, 3)
+
+    assert curve.mul_jac(point, scalar) == curve.mul_wnaf(point, scalar)
+
+
+@pytest.mark.parametrize('scalar', [0, 1, 2, 3, 4, 5, 6, 11, 97, 2 ** 20 + 3])
+def test_zp_curve__fast_scalar_mul(scalar):
+    zp_fast = pytest.importorskip('elliptic_curves.elliptic._zp_fast')
+    curve = ZpCurve(97, 2, 3)
+
+    assert Point(*zp_fast.scalar_mul_affine(0, 10, scalar, 2, 97)) == curve.mul_jac(Point(0, 10), scalar)
+
+
+def test_zp_curve__fast_scalar_mul_p256():
+    zp_fast = pytest.importorskip('elliptic_curves.elliptic._zp_fast')
+    p = 2 ** 256 - 2 ** 224 + 2 ** 192 + 2 ** 96 - 1
+    b = 0x5ac635d8aa3a93e7b3ebbd55769886bc651d06b0cc53b0f63bce3c3e27d2604b
+    gx = 0x6b17d1f2e12c4247f8bce6e563a440f277037d812deb33a0f4a13945d898c296
+    gy = 0x4fe342e2fe1a7f9b8ee7eb4a7c0f9e162bce33576b315ececbb6406837bf51f5
+    curve = ZpCurve(p, -3, b)
+    scalar = 0xc51e4753afdec1e6b6c6a5b992f43f8dd0c7a8933072708b6522468b2ffb06fd
+
+    assert Point(*zp_fast.scalar_mul_affine(gx, gy, scalar, p - 3, p)) == curve.mul_jac(Point(gx, gy), scalar)
+
+
+@pytest.mark.parametrize('scalar', [0, 1, 7, 0b1011, 2 ** 20 + 12345, 3 ** 40])
+@pytest.mark.parametrize('width', [2, 3, 4, 5])
+def test_wnaf_digits(scalar, width):
+    digits = wnaf_digits(scalar, width)
+
+    assert sum(digit << i for i, digit in enumerate(digits)) == scalar
+    assert all(digit == 0 or (digit % 2 and abs(digit) < 2 ** (width - 1)) for digit in digits)
+
+
+@pytest.mark.parametrize('scalar', [0, 1, 2, 5, 6, 13, 100, 2 ** 20 + 3])
+@pytest.mark.parametrize('width', [2, 4])
+def test_zp_curve__mul_wnaf(scalar, width):
+    curve = ZpCurve(97, 2, 3)
+
+    assert curve.mul_wnaf(Point(3, 6), scalar, width) == Curve.mul(curve, Point(3, 6), scalar % 5)
+
+
+@pytest.mark.parametrize('scalar', [0, 1, 2, 3, 4, 5, 6, 11, 97, 2 ** 20 + 3])
+def test_zp_curve__mul_ct(scalar):
+    curve = ZpCurve(97, 2, 3)
+
+    assert curve.mul_ct(Point(0, 10), scalar, bits=21) == curve.mul_jac(Point(0, 10), scalar)
+    assert curve.mul_ct(Point(0, 10), scalar, bits=32) == curve.mul_jac(Point(0, 10), scalar)
+
+
+def test_zp_curve__mul_ct_scalar_too_long():
+    with pytest.raises(ValueError):
+        ZpCurve(97, 2, 3).mul_ct(Point(0, 10), 2 ** 8, bits=8)
+
+
+@pytest.mark.parametrize('scalar', [0, 1, 2, 3, 4, 5, 6, 11, 97, 2 ** 20 + 3, 2 ** 24 - 1])
+@pytest.mark.parametrize('window', [1, 2, 4])
+def test_zp_curve__mul_with_table(scalar, window):
+    curve = ZpCurve(97, 2, 3)
+    table = curve.precompute_base(Point(0, 10), bits=24, window=window)
+
+    assert table.window == window
+    assert len(table.points) == -(-24 // window) * (2 ** window - 1)
+    assert curve.mul_with_table(table, scalar) == curve.mul_jac(Point(0, 10), scalar)
+
+
+def test_zp_curve__precompute_base():
+    curve = ZpCurve(97, 2, 3)
+    table = curve.precompute_base(Point(0, 10), bits=4)
+
+    assert table.points == [curve.mul_jac(Point(0, 10), 2 ** i) for i in range(4)]
+    with pytest.raises(ValueError):
+        curve.mul_with_table(table, 2 ** 4)
+
+
+def test_zp_curve__mul_with_table_uses_table_window():
+    curve = ZpCurve(3, 1, 1)
+    table = curve.precompute_base(Point(0, 1), bits=8, window=2)
+
+    assert curve.mul_with_table(table, 4) == curve.mul_jac(Point(0, 1), 4) == Point.infinity()
+
+
+@pytest.mark.parametrize('scalar', [1, 2, 3, 14, 15, 2 ** 17 + 5])
+def test_gf2_not_supersingular_curve__mul_with_table(gf2_not_supersingular_curve, scalar):
+    point = Point(Polynomial([0., 0., 0., 1.]), Polynomial([0., 1.]))
+    table = gf2_not_supersingular_curve.precompute_base(point, bits=20, window=4)
+
+    assert gf2_not_supersingular_curve.mul_with_table(table, scalar) == gf2_not_supersingular_curve.mul(point, scalar)
+
+
+@pytest.mark.parametrize('scalar', [1, 2, 3, 14, 15, 2 ** 17 + 5])
+def test_gf2_not_supersingular_curve__mul_wnaf(gf2_not_supersingular_curve, scalar):
+    point = Point(Polynomial([0., 0., 0., 1.]), Polynomial([0., 1.]))
+    expected = Point.infinity()
+    for _ in range(scalar % 16):
+        expected = gf2_not_supersingular_curve.add(expected, point)
+
+    assert gf2_not_supersingular_curve.mul_wnaf(point, scalar) == expected
+    assert gf2_not_supersingular_curve.mul(point, scalar) == expected
+
+
 @pytest.mark.parametrize(
     'first_point, second_point, result',
     [
@@ -2,7 +2,8 @@ from typing import List
 
 import pytest
 
-from elliptic_curves.field import GF2PolynomialField, ZpField
+from elliptic_curves import field as field_module
+from elliptic_curves.field import Field, GF2PolynomialField, is_probable_prime, ZpField
 from elliptic_curves.polynomial.polynomial import Polynomial
 
 
@@ -16,6 +17,88 @@ def test_zp_field_invert():
     assert field.invert(-50) == 9
 
 
+def test_zp_field_gmpy2():
+    gmpy2 = pytest.importorskip('gmpy2')
+    field = ZpField(order=11)
+
+    assert isinstance(field.modulus(24), gmpy2.mpz)
+    assert field.invert(3) == 4
+    assert field.invert(0) == 0
+
+
+@pytest.mark.parametrize('order', [11, 12, 2 ** 127 - 1])
+def test_zp_field_invert_without_gmpy2(monkeypatch, order):
+    monkeypatch.setattr(field_module, 'gmpy2', None)
+    field = ZpField(order=order)
+
+    for element in [0, 1, 2, 5, 6, order - 1, -1, order + 7]:
+        assert field.invert(element) == Field.invert(field, element)
+
+
+def test_zp_field_invert_not_prime():
+    field = ZpField(order=12)
+
+    assert field.invert(5) == 5
+    assert field.invert(7) == 7
+    assert field.invert(-1) == 11
+    assert field.invert(2) == 1
+    assert field.invert(8) == 11
+
+
+def test_zp_field_invert_not_invertible_same_without_gmpy2(monkeypatch):
+    elements = [0, 2, 3, 8, 9, 10, 24]
+    expected = [ZpField(order=12).invert(element) for element in elements]
+
+    monkeypatch.setattr(field_module, 'gmpy2', None)
+    assert [ZpField(order=12).invert(element) for element in elements] == expected
+
+
+@pytest.mark.parametrize(
+    'number, result',
+    [
+        (0, False),
+        (1, False),
+        (2, True),
+        (41, True),
+        (97, True),
+        (561, False),
+        (3215031751, False),
+        (2 ** 127 - 1, True),
+        (2 ** 255 - 19, True),
+        (2 ** 256 - 1, False),
+    ],
+)
+def test_is_probable_prime(number, result):
+    assert is_probable_prime(number) is result
+
+
+def test_zp_field_batch_invert():
+    field = ZpField(order=11)
+
+    assert field.batch_invert([3, 12, 0, 24, -1, 11, -50]) == [4, 1, 0, 6, 10, 0, 9]
+    assert field.batch_invert([]) == []
+
+
+@pytest.mark.parametrize('order', [2, 3, 5, 11, 13, 17, 97, 113])
+def test_zp_field_sqrt(order):
+    field = ZpField(order=order)
+    squares = {x * x % order for x in range(order)}
+
+    for element in range(order):
+        root = field.sqrt(element)
+
+        if element in squares:
+            assert root * root % order == element
+        else:
+            assert root is None
+
+
+@pytest.mark.parametrize('order', [9, 15, 21])
+def test_zp_field_sqrt__not_prime(order):
+    with pytest.raises(ValueError):
+        ZpField(order=order).sqrt(4)
+
+
 def test_zp_field_modulus():
     field = ZpField(order=11)
 
@@ -53,6 +136,13 @@ def test_gf2_field_invert(polynomial_coef, invert_polynomial_coef):
     assert_invert(invert_polynomial, polynomial)
 
 
+def test_gf2_field_batch_invert():
+    field = GF2PolynomialField(Polynomial([1., 1., 0., 0., 1.]))
+    elements = [Polynomial([0., 0., 0., 1.]), Polynomial([0.]), Polynomial([1., 1., 0., 1.])]
+
+    assert field.batch_invert(elements) == [field.invert(element) for element in elements]
+
+
 def test_gf2_field_modulus():
     """
     Тест над полем с характеристикой 2 над многочленом x^4 + x + 1
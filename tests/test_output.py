@@ -44,6 +44,14 @@ def test_point_formatter(point_formatter):
     assert point_formatter.format(int_point, {}) == '(14, 27)'
 
 
+def test_point_formatter__explicit_type(registry, int_formatter, point_formatter):
+    gmpy2 = pytest.importorskip('gmpy2')
+    registry.register(int_formatter, type_=gmpy2.mpz)
+
+    mpz_point = Point(x=gmpy2.mpz(14), y=gmpy2.mpz(27))
+    assert point_formatter.format(mpz_point, {'base': 16}) == '(0xe, 0x1b)'
+
+
 def test_task_config_formatter(task_config_formatter):
     task_config_add = TaskConfig(
         task_type=TaskType.ADD,
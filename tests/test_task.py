@@ -1,3 +1,5 @@
+from numbers import Integral
+
 import pytest
 
 from elliptic_curves.elliptic.elliptic import Curve
@@ -98,7 +100,7 @@ def assert_curves_equals(first_curve: Curve, second_curve: Curve):
 def assert_dict_equals(first_dict: dict, second_dict: dict):
     assert len(first_dict) == len(second_dict)
     for key, value in first_dict.items():
-        if isinstance(value, (int, str, Polynomial)):
+        if value is None or isinstance(value, (Integral, str, Polynomial)):
             assert value == second_dict[key]
         else:
             assert_dict_equals(value.__dict__, second_dict[key].__dict__)